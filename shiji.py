@@ -4,44 +4,281 @@ import time
 import requests
 import logging
 import os
+import hashlib
+import bisect
+import queue
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QScrollArea, QGridLayout, QLabel, QSpinBox, QPushButton, 
                             QLineEdit, QHBoxLayout, QFrame, QSizePolicy, QMessageBox, 
                             QInputDialog, QTableWidget, QTableWidgetItem, QDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize, QThreadPool, QRunnable, QUrl
-from PyQt5.QtGui import QPixmap, QFont, QColor
+from PyQt5.QtCore import Qt, QEvent, QObject, QThread, pyqtSignal, QTimer, QSize, QThreadPool, QRunnable, QUrl
+from PyQt5.QtGui import QImage, QPixmap, QPixmapCache, QFont, QColor
 from PyQt5.QtGui import QDesktopServices
 import webbrowser
 from functools import partial
+import math
+
+try:
+    import orjson  # 可选依赖，安装后JSON读写更快
+except ImportError:
+    orjson = None
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 图片下载共用的HTTP会话，复用与CDN之间的连接，避免每张图片都重新握手
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+_HTTP_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept-Encoding": "gzip"
+})
+
+THUMB_CACHE_DIR = 'thumb_cache'  # 缩放后缩略图的本地缓存目录
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024  # 内存中图片缓存的上限(KB)，超出后按LRU淘汰
+IMAGE_PRIORITY_VISIBLE = 10  # 可见卡片的图片优先下载
+IMAGE_PRIORITY_BACKGROUND = 0  # 屏幕外卡片的图片
+CARD_SPACING = 8  # 商品卡片之间的间距
+GRID_MARGIN = 4  # 商品网格的边距
+# 倒计时标签在不同状态下的样式，只在状态切换时设置
+COUNTDOWN_STYLES = {
+    'warn': "color: #E6A23C; font-weight: bold;",
+    'normal': "color: #606266;",
+    'paused': "color: #F56C6C; font-weight: bold;",
+}
+PRODUCT_CACHE_COMPACT_BATCHES = 100  # 商品缓存增量日志积累多少批后整理为完整快照
+
+# 商品卡片样式，设置在卡片容器上，卡片通过state属性(new/normal)切换外观，子控件按objectName匹配
+CARD_STYLESHEET = """
+    QLabel#image {
+        background: #F5F7FA;
+        border-radius: 4px;
+    }
+    QLabel#name {
+        font: 10px 'Microsoft YaHei';
+        color: #303133;
+        max-height: 30px;
+    }
+    QPushButton#view {
+        background: #409EFF;
+        color: white;
+        border-radius: 3px;
+        font: 10px;
+        padding: 1px;
+    }
+    QLabel#new_badge {
+        background: #67C23A;
+        color: white;
+        font: bold 8px;
+        padding: 1px 2px;
+        border-radius: 3px;
+    }
+    QFrame[state="new"], QFrame[state="new"] QFrame {
+        background: #EDF8FF;
+        border-radius: 8px;
+        border: 1px solid #409EFF;
+    }
+    QFrame[state="new"]:hover, QFrame[state="new"] QFrame:hover {
+        border: 2px solid #409EFF;
+        background: #F0F9FF;
+    }
+    QFrame[state="normal"], QFrame[state="normal"] QFrame {
+        background: white;
+        border-radius: 8px;
+        border: 1px solid #EBEEF5;
+    }
+    QFrame[state="normal"]:hover, QFrame[state="normal"] QFrame:hover {
+        border: 1px solid #409EFF;
+        background: #F5F7FA;
+    }
+    QFrame[state] QLabel[state="new"] {
+        font: bold 11px;
+        color: #E6A23C;
+        background: #FDF6EC;
+        padding: 1px 2px;
+        border-radius: 3px;
+    }
+    QFrame[state] QLabel[state="normal"] {
+        font: bold 11px;
+        color: #E6A23C;
+    }
+"""
+
+
+def parse_json(content):
+    """解析JSON字节串，优先使用orjson"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def read_json_file(path):
+    """读取JSON文件"""
+    with open(path, 'rb') as f:
+        return parse_json(f.read())
+
+
+def write_json_file(path, data):
+    """把数据写入JSON文件，先写入临时文件再替换，避免写入中断时损坏原文件"""
+    if orjson is not None:
+        content = orjson.dumps(data)
+    else:
+        content = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def append_json_lines(path, records):
+    """把记录逐行追加到NDJSON文件末尾，每条记录占一行"""
+    if not records:
+        return
+    if orjson is not None:
+        lines = [orjson.dumps(record) for record in records]
+    else:
+        lines = [json.dumps(record, ensure_ascii=False).encode('utf-8') for record in records]
+    with open(path, 'ab') as f:
+        f.write(b'\n'.join(lines) + b'\n')
+
+
+def read_json_lines(path):
+    """逐行读取NDJSON文件，跳过写入中断留下的不完整行"""
+    records = []
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                records.append(parse_json(line))
+            except ValueError:
+                logger.warning(f"跳过 {path} 中无法解析的一行")
+    return records
+
+
+def write_json_snapshot(path, data, log_path):
+    """写入完整的JSON快照，然后删除已合并进快照的增量日志"""
+    write_json_file(path, data)
+    if os.path.exists(log_path):
+        os.remove(log_path)
+
+
+def product_cache_entry(pid, product):
+    """商品缓存中保存的字段，只保存必要的信息"""
+    return {
+        'id': pid,
+        'name': product['name'],
+        'price': product['price'],
+        'image': '',  # 图片URL可能会变化，暂不保存
+        'detail_url': f"https://mall.bilibili.com/neul-next/index.html?itemsId={pid}"
+    }
+
+
+def thumb_cache_path(url):
+    """返回图片URL对应的本地缩略图路径"""
+    return os.path.join(THUMB_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest()[:16] + ".png")
+
+
+class ImageLoaderSignals(QObject):
+    finished = pyqtSignal(object)  # 已缩放的缩略图(QImage)，加载失败时为None
+
+
 class ImageLoader(QRunnable):
     def __init__(self, url, callback):
         super().__init__()
         self.url = url
-        self.callback = callback
+        # 通过信号把结果送回主线程，QPixmap和QPixmapCache只能在主线程使用
+        self.signals = ImageLoaderSignals()
+        self.signals.finished.connect(callback)
 
     def run(self):
+        image = None
         try:
-            response = requests.get(self.url, timeout=10)
-            if response.status_code == 200:
-                self.callback(response.content)
+            # 优先使用本地已缩放好的缩略图
+            path = thumb_cache_path(self.url)
+            if os.path.exists(path):
+                image = QImage(path)
+            else:
+                # 分块读取到同一个缓冲区中，直接交给QImage解码，不再额外拼接一份bytes
+                with _HTTP_SESSION.get(self.url, stream=True, timeout=10) as response:
+                    if response.status_code == 200:
+                        buffer = bytearray()
+                        for chunk in response.iter_content(65536):
+                            buffer.extend(chunk)
+                        image = QImage()
+                        if image.loadFromData(buffer):
+                            # 解码、缩放和保存缩略图都在后台线程完成，主线程只需转换为QPixmap
+                            image = image.scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                            # 先写入临时文件再替换，避免同一图片的多个任务同时写入
+                            tmp_path = f"{path}.{id(self)}.tmp"
+                            if image.save(tmp_path, "PNG"):
+                                os.replace(tmp_path, path)
         except Exception as e:
             logger.error(f"图片下载失败: {str(e)}")
+        # 失败时发送None，通知主线程之后可以重新请求该图片
+        if image is not None and image.isNull():
+            image = None
+        self.signals.finished.emit(image)
+
+
+class PersistenceWorker(QThread):
+    """在后台线程按提交顺序执行文件写入"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.queue = queue.Queue()
+
+    def submit(self, func, *args):
+        """提交一个写入任务，func在后台线程中以args调用"""
+        self.queue.put((func, args))
+
+    def stop(self):
+        """执行完队列中剩余的任务后退出线程"""
+        self.queue.put(None)
+        self.wait()
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            func, args = item
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"后台写入文件失败: {str(e)}")
+
 
 class ProductMonitor(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.product_cache = {}  # 所有历史商品缓存
+        self.product_data = OrderedDict()  # 所有历史商品数据，只保存数据不保存控件，最近刷新的排在最前面
+        self.name_index = {}  # 商品ID -> 小写商品名，搜索时直接匹配
+        self.visible_cards = {}  # 当前可见区域内已创建的商品卡片
+        self._card_pool = []  # 回收的商品卡片，滚动时重复使用
+        self.display_ids = []  # 左侧按显示顺序排列的商品ID（已过滤）
         self.min_price_products = {}  # 同名商品的最低价记录
+        self.min_price_sorted = []  # 按价格排序的(价格, 商品名)列表，与min_price_products同步维护
+        self.sidebar_products = []  # 侧边栏当前要显示的商品（已排序、已过滤）
+        self.sidebar_shown = 0  # 侧边栏已创建卡片的商品数量
+        self.sidebar_cards = {}  # 商品名 -> 侧边栏中正在显示的卡片，重建时按商品名复用
+        self._sidebar_entries = {}  # 商品名 -> (最低价记录, 转换后的卡片数据)
+        self._sidebar_dirty = False  # 侧边栏内容已过期，等到显示时再创建
         self.refresh_interval = 5
         self.cookies = self.load_cookies()
         self.thread_pool = QThreadPool.globalInstance()
-        self.thread_pool.setMaxThreadCount(5)  # 限制最大线程数
-        self.image_cache = {}  # 用于缓存已加载的图片
+        # 图片下载主要耗时在网络等待上，线程数可以比CPU核心数多一些，但至少保留5个
+        self.thread_pool.setMaxThreadCount(max(5, QThread.idealThreadCount()))
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        os.makedirs(THUMB_CACHE_DIR, exist_ok=True)  # 后台线程保存缩略图前目录必须已存在
+        self._image_requests = {}  # 正在下载的图片URL -> {'labels': 等待的标签, 'priority': 已提交的最高优先级, 'pending': 未完成的任务数}
         self.last_refresh_count = 0  # 上次刷新获取的商品数量
         self.total_products_count = 0  # 总商品数量
         self.last_refresh_ids = set()  # 上次刷新的商品ID集合
@@ -54,6 +291,33 @@ class ProductMonitor(QMainWindow):
         self.remaining_time = 0  # 下次刷新剩余时间（秒）
         self.price_alert_enabled = False  # 价格提醒开关
         self.price_alert_threshold = 0  # 价格提醒阈值
+        self._countdown_mode = None  # 倒计时标签当前的样式状态
+        self._settings_cache = None  # 上次读取或写入的设置内容
+        self._settings_mtime = None  # settings.json的修改时间
+        # 合并短时间内的多次设置修改（如连续调整数值框），只写一次文件
+        self._save_settings_timer = QTimer(self)
+        self._save_settings_timer.setSingleShot(True)
+        self._save_settings_timer.timeout.connect(self.save_settings)
+        # 最低价记录在刷新时频繁变化，合并为1秒内最多写一次
+        self._save_min_timer = QTimer(self)
+        self._save_min_timer.setSingleShot(True)
+        self._save_min_timer.timeout.connect(self.save_min_price_products)
+        # 商品缓存在后台线程写入，每次刷新后合并为1秒内最多提交一次
+        # 平时只追加变化的商品，积累一定批次后再整理为完整快照
+        self._dirty_ids = set()  # 上次保存后数据有变化的商品ID
+        self._cache_log_batches = 0  # 增量日志中尚未合并的批次数
+        self._cache_compact_pending = False  # 下次保存时需要写入完整快照
+        self._cache_order_dirty = False  # 商品显示顺序有变化，关闭程序时需要写入完整快照
+        self.persistence_worker = PersistenceWorker(self)
+        self.persistence_worker.start()
+        self._save_cache_timer = QTimer(self)
+        self._save_cache_timer.setSingleShot(True)
+        self._save_cache_timer.timeout.connect(self.save_product_cache)
+        # 统计信息在一批更新中可能被多次修改，合并到下一帧统一刷新
+        self._stats_dirty = False
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.timeout.connect(self.update_statistics)
         self.load_settings()  # 加载设置
         self.load_product_cache()  # 加载之前保存的商品缓存
         self.init_ui()
@@ -65,7 +329,11 @@ class ProductMonitor(QMainWindow):
         # 从本地加载历史最低价记录
         self.load_min_price_products()
         
-        # 窗口大小变化时重新布局
+        # 窗口大小变化时重新布局，拖动窗口期间合并为一次调整
+        self._last_resize_width = None  # 上次自动调整列数时的滚动区域宽度
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self.apply_resize_layout)
         self.resizeEvent = self.on_resize
         
         # 启动倒计时定时器（每秒更新一次）
@@ -75,14 +343,25 @@ class ProductMonitor(QMainWindow):
 
     def on_resize(self, event):
         """窗口大小变化时调整布局"""
+        # 拖动窗口时每个像素都会触发，停止变化150毫秒后再统一调整
+        self._resize_timer.start(150)
+        super().resizeEvent(event)
+
+    def apply_resize_layout(self):
+        """根据当前窗口大小调整每行列数"""
         try:
             # 计算每行可以放置的卡片数量
             scroll_width = self.scroll.width() - 30  # 减去滚动条宽度和边距
             visible_columns = max(1, scroll_width // (self.card_width + 8))  # 8是间距
             
+            # 宽度变化不足半张卡片时保持列数不变，避免在列宽边界附近来回切换
+            moved_enough = (self._last_resize_width is None or
+                            abs(scroll_width - self._last_resize_width) > (self.card_width + 8) // 2)
+            
             # 如果计算的列数与设置不同，且不为0，则更新列数
-            if visible_columns != self.columns_count and visible_columns > 0:
+            if visible_columns != self.columns_count and visible_columns > 0 and moved_enough:
                 logger.info(f"自动调整列数: {self.columns_count} -> {visible_columns}")
+                self._last_resize_width = scroll_width
                 self.columns_count = visible_columns
                 self.columns_spinner.setValue(visible_columns)
                 
@@ -99,15 +378,17 @@ class ProductMonitor(QMainWindow):
                 self.update_sidebar()
         except Exception as e:
             logger.error(f"调整布局失败: {str(e)}")
-        
-        super().resizeEvent(event)
     
     def load_settings(self):
         """加载设置"""
         try:
             if os.path.exists('settings.json'):
-                with open('settings.json', 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
+                # 文件未被修改时直接使用缓存的内容，不再重新解析
+                mtime = os.path.getmtime('settings.json')
+                if mtime != self._settings_mtime:
+                    self._settings_cache = read_json_file('settings.json')
+                    self._settings_mtime = mtime
+                settings = self._settings_cache
                 self.columns_count = settings.get('columns_count', 8)
                 self.sidebar_columns_count = settings.get('sidebar_columns_count', 3)
                 self.api_cooldown = settings.get('api_cooldown', 2000)
@@ -131,8 +412,12 @@ class ProductMonitor(QMainWindow):
                 'price_alert_threshold': self.price_alert_threshold,
                 'price_alert_enabled': self.price_alert_enabled
             }
-            with open('settings.json', 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False)
+            # 设置没有变化时不重复写入
+            if settings == self._settings_cache:
+                return
+            write_json_file('settings.json', settings)
+            self._settings_cache = settings
+            self._settings_mtime = os.path.getmtime('settings.json')
             logger.info("已保存设置")
         except Exception as e:
             logger.error(f"保存设置失败: {str(e)}")
@@ -140,14 +425,14 @@ class ProductMonitor(QMainWindow):
     def update_columns(self, value):
         """更新列数"""
         self.columns_count = value
-        self.save_settings()
+        self._save_settings_timer.start(500)
         self.refresh_layout_with_recent_first()
         logger.info(f"更新列数为: {value}")
         
     def update_cooldown(self, value):
         """更新API冷却时间"""
         self.api_cooldown = value * 1000  # 秒转毫秒
-        self.save_settings()
+        self._save_settings_timer.start(500)
         self.worker_thread.api_cooldown = self.api_cooldown
         logger.info(f"更新API冷却时间为: {value}秒 ({self.api_cooldown}ms)")
 
@@ -157,22 +442,65 @@ class ProductMonitor(QMainWindow):
         logger.error(f"错误: {error_message}")  # 在日志中记录错误信息
         QMessageBox.warning(self, "错误", f"发生错误: {error_message}")
 
-    def load_image(self, label, image_data):
-        """异步加载图片并缓存"""
+    def load_image(self, url, image):
+        """把后台线程缩放好的图片转换为QPixmap并缓存，显示到所有等待该图片的标签上"""
+        request = self._image_requests.get(url)
+        if request is None:
+            return
+        request['pending'] -= 1
+        # 同一URL还有更高优先级提交的任务未完成时，等待它的结果
+        if image is None and request['pending'] > 0:
+            return
+        del self._image_requests[url]
+        labels = request['labels']
+        if image is None:
+            return
         try:
-            # 检查是否已经缓存
-            if image_data in self.image_cache:
-                pixmap = self.image_cache[image_data]
-            else:
-                pixmap = QPixmap()
-                pixmap.loadFromData(image_data)
-                pixmap = pixmap.scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation)  # 缩放图片
-                self.image_cache[image_data] = pixmap  # 缓存图片
+            # 检查是否已经缓存，同一URL可能在排队期间已被其他任务加载
+            pixmap = QPixmapCache.find(url)
+            if pixmap is None:
+                pixmap = QPixmap.fromImage(image)
+                QPixmapCache.insert(url, pixmap)  # 缓存图片
 
-            label.setPixmap(pixmap)
+            for label in labels:
+                # 卡片可能已被重复使用并绑定了其他图片
+                if getattr(label, 'image_url', url) == url:
+                    label.setPixmap(pixmap)
         except Exception as e:
             logger.error(f"图片加载失败: {str(e)}")
-            label.setText("图片加载失败")
+            for label in labels:
+                if getattr(label, 'image_url', url) == url:
+                    label.setText("图片加载失败")
+
+    def load_image_async(self, label, url, priority=IMAGE_PRIORITY_BACKGROUND):
+        """加载图片到标签，已缓存的图片直接显示，否则按优先级交给线程池下载
+
+        同一URL正在下载时只登记等待的标签，不重复下载；
+        已排队的任务无法调整优先级，更高优先级的请求会以新的优先级再提交一次，先完成的任务负责显示
+        """
+        pixmap = QPixmapCache.find(url)
+        if pixmap is not None:
+            label.setPixmap(pixmap)
+            return
+        request = self._image_requests.get(url)
+        if request is None:
+            request = self._image_requests[url] = {'labels': [], 'priority': priority, 'pending': 0}
+        elif priority <= request['priority']:
+            request['labels'].append(label)
+            return
+        request['labels'].append(label)
+        request['priority'] = priority
+        request['pending'] += 1
+        self.thread_pool.start(ImageLoader(url, partial(self.load_image, url)), priority)
+
+    def sidebar_image_priority(self, row):
+        """侧边栏中位于可见区域的行优先加载图片"""
+        row_height = self.card_height + CARD_SPACING
+        top = self.sidebar_scroll.verticalScrollBar().value()
+        bottom = top + self.sidebar_scroll.viewport().height()
+        if row * row_height <= bottom and (row + 1) * row_height >= top:
+            return IMAGE_PRIORITY_VISIBLE
+        return IMAGE_PRIORITY_BACKGROUND
 
     def update_status(self, message):
         """更新状态栏的消息"""
@@ -180,63 +508,41 @@ class ProductMonitor(QMainWindow):
 
     def filter_products(self):
         """根据搜索框中的内容过滤商品"""
-        search_text = self.search_input.text().lower()
-        visible_count = 0
-        
-        for product_id, widget in self.product_cache.items():
-            product_name = widget.findChild(QLabel, "name").text().lower()
-            if search_text in product_name:
-                widget.setVisible(True)
-                visible_count += 1
-            else:
-                widget.setVisible(False)
-                
-        self.update_status(f"显示 {visible_count} 件商品 (共 {len(self.product_cache)} 件)")
+        # 过滤条件在重新布局时应用，只会为可见区域创建卡片
+        self.refresh_layout_with_recent_first()
+        self.update_status(f"显示 {len(self.display_ids)} 件商品 (共 {len(self.product_data)} 件)")
 
     def filter_sidebar_products(self):
         """根据搜索框中的内容过滤右侧历史最低价商品"""
         search_text = self.sidebar_search_input.text().lower()
         visible_count = 0
-        
+        self._sidebar_dirty = False
+        
+        # 重建期间暂停绘制和布局计算，并把容器从滚动区域中取出，
+        # 避免每添加一个控件都触发一次布局和重绘
+        self.sidebar_container.setUpdatesEnabled(False)
+        self.sidebar_grid.setEnabled(False)
+        self.sidebar_scroll.takeWidget()
+        old_cards = self.take_sidebar_cards()
         try:
-            # 安全地清除布局中的所有控件
-            while self.sidebar_grid.count():
-                item = self.sidebar_grid.takeAt(0)
-                if item and item.widget():
-                    item.widget().deleteLater()
-                
-            # 重新添加符合条件的商品
-            filtered_products = [p for p in self.min_price_products.values() 
-                                if search_text in p['name'].lower()]
-            
-            # 按价格排序（从低到高）
-            filtered_products = sorted(filtered_products, key=lambda x: x['price'])
-            
-            # 以网格形式显示过滤后的商品
-            row = 0
-            col = 0
-            for product in filtered_products:
-                # 确保产品有id字段
-                min_price_product = {
-                    'id': product.get('name', '').replace(' ', '_'),  # 使用name作为id
-                    'name': product.get('name', '未知商品'),
-                    'price': product.get('price', 0),
-                    'image': product.get('image', ''),
-                    'detail_url': product.get('url', '')
-                }
-                # 使用同样的卡片样式，但不标记为新商品
-                card = self.add_product_card(min_price_product, is_new=False)
-                self.sidebar_grid.addWidget(card, row, col)
-                col += 1
-                if col >= self.sidebar_columns_count:  # 使用设置的列数
-                    col = 0
-                    row += 1
-                visible_count += 1
+            # 重新添加符合条件的商品，列表已按价格从低到高排序
+            self.sidebar_products = [self.min_price_products[name] for price, name in self.min_price_sorted
+                                     if search_text in name.lower()]
+            visible_count = len(self.sidebar_products)
+            self.sidebar_shown = 0
+            self.append_sidebar_cards(old_cards)
                 
             self.update_status(f"侧边栏显示 {visible_count} 件最低价商品 (共 {len(self.min_price_products)} 件)")
         except Exception as e:
             logger.error(f"筛选边栏商品时出错: {str(e)}")
             self.update_status(f"筛选边栏商品时出错: {str(e)}")
+        finally:
+            self.sidebar_grid.setEnabled(True)
+            self.sidebar_scroll.setWidget(self.sidebar_container)
+            self.sidebar_container.setUpdatesEnabled(True)
+            # 没有被复用的卡片回收到对象池
+            for card in old_cards.values():
+                self.release_card(card)
 
     def clear_layout(self, layout):
         """清除布局中的所有控件"""
@@ -252,87 +558,6 @@ class ProductMonitor(QMainWindow):
                 elif item.layout():
                     self.clear_layout(item.layout())
 
-    def create_sidebar_item(self, product):
-        """创建侧边栏商品项 - 列表形式，更紧凑的版本"""
-        item = QFrame()
-        item.setObjectName(f"sidebar_item_{product['name']}")
-        item.setStyleSheet("""
-            QFrame {
-                background: #F4F4F4;
-                border-radius: 4px;
-                padding: 6px;
-                margin-bottom: 6px;
-            }
-            QFrame:hover {
-                background: #E6F1FC;
-                border: 1px solid #409EFF;
-            }
-        """)
-        
-        # 使用水平布局
-        layout = QHBoxLayout(item)
-        layout.setContentsMargins(6, 6, 6, 6)
-        layout.setSpacing(6)
-        
-        # 添加商品预览图
-        img_label = QLabel()
-        img_label.setFixedSize(40, 40)  # 缩小图片
-        img_label.setAlignment(Qt.AlignCenter)
-        img_label.setStyleSheet("background: #F5F7FA; border-radius: 4px;")
-        
-        self.thread_pool.start(ImageLoader(
-            product['image'],
-            partial(self.load_image, img_label)
-        ))
-        layout.addWidget(img_label)
-
-        # 商品信息垂直布局
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
-        
-        name_label = QLabel(product['name'])
-        name_label.setStyleSheet("font: 12px 'Microsoft YaHei'; color: #303133;")
-        name_label.setWordWrap(True)
-        name_label.setMaximumHeight(40)
-        name_label.setToolTip(product['name'])  # 添加工具提示，鼠标悬停时显示完整名称
-        info_layout.addWidget(name_label)
-
-        # 价格和时间的水平布局
-        price_time_layout = QHBoxLayout()
-        price_time_layout.setSpacing(4)
-        
-        price_label = QLabel(f"¥{product['price']:.2f}")
-        price_label.setStyleSheet("font: bold 14px; color: #E6A23C;")
-        price_time_layout.addWidget(price_label)
-        
-        price_time_layout.addStretch()
-        
-        # 时间标签
-        time_str = time.strftime("%Y-%m-%d %H:%M", time.localtime(product['timestamp']))
-        time_label = QLabel(f"{time_str}")
-        time_label.setStyleSheet("font: 10px; color: #909399;")
-        price_time_layout.addWidget(time_label)
-        
-        info_layout.addLayout(price_time_layout)
-        layout.addLayout(info_layout, 1)  # 1表示拉伸因子，使信息部分占据更多空间
-        
-        # 添加查看按钮
-        view_btn = QPushButton("查看")
-        view_btn.setFixedSize(36, 24)  # 缩小按钮
-        view_btn.setStyleSheet("""
-            background: #409EFF;
-            color: white;
-            border-radius: 4px;
-            font: 11px;
-            padding: 1px;
-        """)
-        view_btn.clicked.connect(lambda: self.open_url(product['url']))
-        layout.addWidget(view_btn)
-
-        # 点击整个卡片也可以打开链接
-        item.mousePressEvent = lambda e: self.open_url(product['url'])
-        return item
-
     def refresh_data(self):
         """手动刷新数据"""
         # 如果暂停了，不自动刷新，但手动点击刷新按钮仍然可以刷新
@@ -363,8 +588,7 @@ class ProductMonitor(QMainWindow):
         cookie_value = self.cookie_input.text()
         cookies = {"cookie": cookie_value}
         try:
-            with open('cookies.json', 'w') as f:
-                json.dump(cookies, f)
+            write_json_file('cookies.json', cookies)
             self.update_status("Cookie已保存")
             logger.info("Cookie已保存")
         except Exception as e:
@@ -374,8 +598,7 @@ class ProductMonitor(QMainWindow):
     def load_cookies(self):
         """加载保存的Cookie"""
         try:
-            with open('cookies.json', 'r') as f:
-                return json.load(f)
+            return read_json_file('cookies.json')
         except (FileNotFoundError, json.JSONDecodeError):
             return {}  # 返回空字典如果文件不存在或解析失败
 
@@ -386,8 +609,7 @@ class ProductMonitor(QMainWindow):
     def save_min_price_products(self):
         """保存历史最低价商品记录到文件"""
         try:
-            with open('min_price_history.json', 'w', encoding='utf-8') as f:
-                json.dump(self.min_price_products, f, ensure_ascii=False)
+            write_json_file('min_price_history.json', self.min_price_products)
             logger.info("历史最低价商品记录已保存")
         except Exception as e:
             logger.error(f"保存历史最低价商品记录失败: {str(e)}")
@@ -396,8 +618,7 @@ class ProductMonitor(QMainWindow):
         """从本地文件加载历史最低价商品记录"""
         try:
             if os.path.exists('min_price_history.json'):
-                with open('min_price_history.json', 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = read_json_file('min_price_history.json')
                 
                 # 确保每个记录都有id字段
                 self.min_price_products = {}
@@ -406,13 +627,37 @@ class ProductMonitor(QMainWindow):
                         # 如果没有id，用name代替
                         product['id'] = name.replace(' ', '_')
                     self.min_price_products[name] = product
+                self.min_price_sorted = sorted((p['price'], name) for name, p in self.min_price_products.items())
                 
                 logger.info(f"已加载 {len(self.min_price_products)} 件历史最低价商品记录")
-                # 更新右侧边栏
-                self.update_sidebar()
+                # 右侧边栏等到显示时再创建卡片
+                self._sidebar_dirty = True
         except Exception as e:
             logger.error(f"加载历史最低价商品记录失败: {str(e)}")
             self.min_price_products = {}
+            self.min_price_sorted = []
+
+    def set_min_price_product(self, name, product):
+        """更新商品的最低价记录，同时维护按价格排序的列表
+
+        两个结构需要一起修改，只能在主线程中调用，工作线程的结果通过apply_min_price_deltas合并
+        """
+        old_product = self.min_price_products.get(name)
+        if old_product is not None:
+            key = (old_product['price'], name)
+            index = bisect.bisect_left(self.min_price_sorted, key)
+            if index < len(self.min_price_sorted) and self.min_price_sorted[index] == key:
+                del self.min_price_sorted[index]
+        self.min_price_products[name] = product
+        bisect.insort(self.min_price_sorted, (product['price'], name))
+
+    def apply_min_price_deltas(self, deltas):
+        """在主线程中合并工作线程发现的更低价格"""
+        for name, product in deltas:
+            previous = self.min_price_products.get(name)
+            # 最低价记录可能在请求期间被修改或清除，以当前记录为准再比较一次
+            if previous is None or product['price'] < previous['price']:
+                self.set_min_price_product(name, product)
 
     def clear_min_price_history(self):
         """清除历史最低价商品记录"""
@@ -420,6 +665,8 @@ class ProductMonitor(QMainWindow):
                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             self.min_price_products = {}
+            self.min_price_sorted = []
+            self._sidebar_entries = {}
             self.save_min_price_products()
             self.update_sidebar()
             self.update_status("历史最低价商品记录已清除")
@@ -429,16 +676,18 @@ class ProductMonitor(QMainWindow):
         reply = QMessageBox.question(self, "确认清除", "确定要清除左侧所有商品记录吗？",
                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            # 安全地清除商品并释放资源
-            while self.grid.count():
-                item = self.grid.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
+            # 回收可见的商品卡片，留待之后重复使用
+            for card in self.visible_cards.values():
+                self.release_card(card)
+            self.visible_cards.clear()
                     
-            self.product_cache.clear()
-            self.total_products_count = 0
+            self.product_data.clear()
+            self.name_index.clear()
+            # 增量日志无法表达删除，下次保存时重写完整快照
+            self._dirty_ids.clear()
+            self._cache_compact_pending = True
+            self.refresh_layout_with_recent_first()
             self.update_status("左侧商品记录已清除")
-            self.update_statistics()
 
     def init_ui(self):
         """初始化界面（优化版）"""
@@ -651,7 +900,11 @@ class ProductMonitor(QMainWindow):
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 搜索商品名称...")
-        self.search_input.textChanged.connect(self.filter_products)
+        # 输入停止200毫秒后再过滤，避免每输入一个字符都过滤一次
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self.filter_products)
+        self.search_input.textChanged.connect(lambda: self._filter_timer.start(200))
         self.search_input.setMinimumWidth(200)
         
         left_header.addWidget(left_title)
@@ -690,11 +943,12 @@ class ProductMonitor(QMainWindow):
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
         self.scroll.setStyleSheet("background: transparent;")
+        # 商品卡片不放入布局，而是按位置摆放在容器中，只创建可见行的卡片
         self.container = QWidget()
-        self.grid = QGridLayout(self.container)
-        self.grid.setSpacing(8)  # 减小间距
-        self.grid.setContentsMargins(4, 4, 4, 4)  # 减小边距
+        self.container.setStyleSheet(CARD_STYLESHEET)
         self.scroll.setWidget(self.container)
+        self.scroll.verticalScrollBar().valueChanged.connect(self.render_visible_cards)
+        self.scroll.verticalScrollBar().rangeChanged.connect(self.render_visible_cards)
         left_layout.addWidget(self.scroll)
 
         # 右侧边栏
@@ -716,7 +970,10 @@ class ProductMonitor(QMainWindow):
         
         self.sidebar_search_input = QLineEdit()
         self.sidebar_search_input.setPlaceholderText("🔍 搜索低价商品...")
-        self.sidebar_search_input.textChanged.connect(self.filter_sidebar_products)
+        self._sidebar_filter_timer = QTimer(self)
+        self._sidebar_filter_timer.setSingleShot(True)
+        self._sidebar_filter_timer.timeout.connect(self.filter_sidebar_products)
+        self.sidebar_search_input.textChanged.connect(lambda: self._sidebar_filter_timer.start(200))
         self.sidebar_search_input.setMinimumWidth(150)
         
         right_header.addWidget(right_title)
@@ -729,10 +986,14 @@ class ProductMonitor(QMainWindow):
         self.sidebar_scroll.setWidgetResizable(True)
         self.sidebar_scroll.setStyleSheet("background: transparent;")
         self.sidebar_container = QWidget()
+        self.sidebar_container.setStyleSheet(CARD_STYLESHEET)
         self.sidebar_grid = QGridLayout(self.sidebar_container)
         self.sidebar_grid.setSpacing(8)  # 减小间距
         self.sidebar_grid.setContentsMargins(4, 4, 4, 4)  # 减小边距
         self.sidebar_scroll.setWidget(self.sidebar_container)
+        self.sidebar_scroll.verticalScrollBar().valueChanged.connect(self.on_sidebar_scroll)
+        self.sidebar_scroll.verticalScrollBar().rangeChanged.connect(self.on_sidebar_scroll)
+        self.sidebar_scroll.installEventFilter(self)
         right_layout.addWidget(self.sidebar_scroll)
 
         # 设置分割比例
@@ -762,35 +1023,6 @@ class ProductMonitor(QMainWindow):
         self.refresh_layout_with_recent_first()
         self.update_status("准备就绪")
         
-    def refresh_layout(self):
-        """刷新界面布局，显示已缓存的商品"""
-        try:
-            # 安全地清除网格布局中的所有控件，但不删除控件本身
-            while self.grid.count():
-                item = self.grid.takeAt(0)
-                if item and item.widget():
-                    item.widget().setParent(None)
-                    
-            # 按照添加时间排序（保持最新的商品在前面）
-            row = 0
-            col = 0
-            # 使用列表而不是字典的values()方法，避免迭代过程中的顺序问题
-            widgets = list(self.product_cache.values())
-            # 从后向前迭代，保证最新添加的在前面
-            for widget in reversed(widgets):
-                self.grid.addWidget(widget, row, col)
-                col += 1
-                if col >= 4:  # 每行4个商品，增加一行的商品数量
-                    col = 0
-                    row += 1
-                    
-            # 更新统计信息
-            self.total_products_count = len(self.product_cache)
-            self.update_statistics()
-        except Exception as e:
-            logger.error(f"刷新布局时出错: {str(e)}")
-            self.update_status(f"刷新布局时出错: {str(e)}")
-    
     def load_more_data(self):
         """加载更多商品数据"""
         self.load_more_btn.setEnabled(False)
@@ -799,14 +1031,23 @@ class ProductMonitor(QMainWindow):
         self.worker_thread.auto_load_more = False  # 手动加载时不自动继续加载
         self.worker_thread.start()
         
+    def mark_statistics_dirty(self):
+        """标记统计信息需要更新，同一批次内只刷新一次"""
+        if not self._stats_dirty:
+            self._stats_dirty = True
+            self._stats_timer.start(16)
+
     def update_statistics(self):
         """更新统计信息"""
+        self._stats_dirty = False
+        refresh_time = time.strftime('%H:%M:%S')
         self.total_label.setText(f"总商品数: {self.total_products_count}")
         self.refresh_count_label.setText(f"本次刷新: {self.last_refresh_count} 件")
-        self.time_label.setText(f"上次刷新: {time.strftime('%H:%M:%S')}")
+        self.time_label.setText(f"上次刷新: {refresh_time}")
 
-    def update_products(self, products):
+    def update_products(self, products, min_price_deltas=()):
         """优化性能的商品更新"""
+        self.apply_min_price_deltas(min_price_deltas)
         if not products:
             self.refresh_btn.setEnabled(True)
             self.load_more_btn.setEnabled(True)
@@ -819,194 +1060,170 @@ class ProductMonitor(QMainWindow):
             
             # 记录本次刷新的商品数量
             self.last_refresh_count = len(products)
-            logger.info(f"本次获取到 {self.last_refresh_count} 件商品")
+            logger.info("本次获取到 %d 件商品", self.last_refresh_count)
             
-            # 保存上次刷新的标记，准备标记新的一批
-            old_refresh_ids = self.last_refresh_ids.copy()
             # 获取当前刷新商品的ID集合，作为最近刷新的标记
+            # 卡片的"新"标记在绑定卡片时根据该集合设置，无需逐个修改已有卡片
             self.last_refresh_ids = {product['id'] for product in products}
             
-            # 首先取消之前刷新商品的标记
-            for pid in old_refresh_ids:
-                if pid in self.product_cache:
-                    # 只更新样式为非新刷新，而不是重新创建卡片
-                    card = self.product_cache[pid]
-                    card.setStyleSheet("""
-                        QFrame {
-                            background: white;
-                            border-radius: 8px;
-                            border: 1px solid #EBEEF5;
-                        }
-                        QFrame:hover {
-                            border: 1px solid #409EFF;
-                            background: #F5F7FA;
-                        }
-                    """)
-                    # 查找并移除"刚刷新"标签
-                    for i in range(card.layout().count()):
-                        item = card.layout().itemAt(i)
-                        if item and item.layout():
-                            for j in range(item.layout().count()):
-                                widget = item.layout().itemAt(j).widget()
-                                if isinstance(widget, QLabel) and widget.text() == "新":
-                                    widget.hide()
-                                    widget.deleteLater()
+            # 用集合运算区分新商品和已有商品，分别记录数量
+            by_id = {product['id']: product for product in products}
+            new_ids = by_id.keys() - self.product_data.keys()
+            existing_ids = by_id.keys() - new_ids
+            new_products_count = len(new_ids)
+            updated_products_count = len(existing_ids)
             
-            # 分别记录新商品和更新商品的数量
-            new_products_count = 0
-            updated_products_count = 0
+            # 新商品和名称、价格有变化的已有商品需要写入缓存
+            self._dirty_ids.update(new_ids)
+            for pid in existing_ids:
+                old_product = self.product_data[pid]
+                product = by_id[pid]
+                if old_product['name'] != product['name'] or old_product['price'] != product['price']:
+                    self._dirty_ids.add(pid)
             
-            # 遍历刷新到的所有商品（不管是否存在）
-            for product in products:
-                if product['id'] not in self.product_cache:
-                    # 新商品，创建卡片并添加到缓存
-                    self.product_cache[product['id']] = self.add_product_card(product, is_new=True)
-                    new_products_count += 1
-                    logger.info(f"添加新商品: {product['id']} - {product['name']} - ¥{product['price']}")
-                else:
-                    # 已存在的商品，更新为新刷新状态
-                    old_card = self.product_cache[product['id']]
-                    # 更新样式为新刷新
-                    old_card.setStyleSheet("""
-                        QFrame {
-                            background: #EDF8FF;
-                            border-radius: 8px;
-                            border: 1px solid #409EFF;
-                        }
-                        QFrame:hover {
-                            border: 2px solid #409EFF;
-                            background: #F0F9FF;
-                        }
-                    """)
-                    # 添加"刚刷新"标签
-                    for i in range(old_card.layout().count()):
-                        item = old_card.layout().itemAt(i)
-                        if item and item.layout() and "price_layout" in item.layout().objectName():
-                            # 找到价格布局，添加"刚刷新"标签
-                            price_layout = item.layout()
-                            new_label = QLabel("新")
-                            new_label.setStyleSheet("""
-                                background: #67C23A;
-                                color: white;
-                                font: bold 8px;
-                                padding: 1px 2px;
-                                border-radius: 3px;
-                            """)
-                            price_layout.insertWidget(0, new_label)
-                            break
-                    updated_products_count += 1
-                    logger.info(f"更新商品标记: {product['id']} - {product['name']} - ¥{product['price']}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for pid in new_ids:
+                    logger.debug("添加新商品: %s - %s - ¥%s", pid, by_id[pid]['name'], by_id[pid]['price'])
+                for pid in existing_ids:
+                    logger.debug("更新商品标记: %s - %s - ¥%s", pid, by_id[pid]['name'], by_id[pid]['price'])
+            
+            self.product_data.update(by_id)
+            self.name_index.update((pid, product['name'].lower()) for pid, product in by_id.items())
+            
+            # 把本次刷新的商品按接口返回的顺序移到最前面，布局时直接按顺序显示
+            for product in reversed(products):
+                self.product_data.move_to_end(product['id'], last=False)
+            self._cache_order_dirty = True
             
             # 更新总商品数
-            self.total_products_count = len(self.product_cache)
-            logger.info(f"商品缓存总数: {self.total_products_count}, 新增: {new_products_count}, 更新: {updated_products_count}")
+            self.total_products_count = len(self.product_data)
+            logger.info("商品缓存总数: %d, 新增: %d, 更新: %d", self.total_products_count, new_products_count, updated_products_count)
             
             # 重新布局所有商品，把最近刷新的放在最前面
-            self.refresh_layout_with_recent_first()
+            # 布局期间暂停整个视口的绘制，所有卡片改动合并为一次重绘
+            viewport = self.scroll.viewport()
+            viewport.setUpdatesEnabled(False)
+            try:
+                self.refresh_layout_with_recent_first()
+            finally:
+                viewport.setUpdatesEnabled(True)
             
             # 保存最低价商品记录
             if self.min_price_products:
-                self.save_min_price_products()
+                self._save_min_timer.start(1000)
             
             # 保存商品缓存
-            self.save_product_cache()
-                
-            # 更新右侧边栏
-            self.update_sidebar()
+            self._save_cache_timer.start(1000)
+            
             self.refresh_btn.setEnabled(True)
             self.load_more_btn.setEnabled(True)
             
             # 更新统计信息
-            self.update_statistics()
+            self.mark_statistics_dirty()
             
             status_msg = f"已获取 {len(products)} 件商品，新增 {new_products_count} 件，总计 {self.total_products_count} 件"
             self.update_status(status_msg)
+            
+            # 右侧边栏放到下一轮事件循环中更新，让左侧新商品先绘制出来
+            QTimer.singleShot(0, partial(self.post_refresh_work, status_msg))
         except Exception as e:
             logger.error(f"更新商品时出错: {str(e)}")
             self.update_status(f"更新商品时出错: {str(e)}")
             self.refresh_btn.setEnabled(True)
             self.load_more_btn.setEnabled(True)
 
+    def post_refresh_work(self, status_msg):
+        """刷新后不影响左侧显示的工作，在新商品绘制之后执行"""
+        self.update_sidebar()
+        # 更新侧边栏会改写状态栏，恢复本次刷新的结果
+        self.update_status(status_msg)
+
     def refresh_layout_with_recent_first(self):
         """刷新界面布局，把最近刷新的商品放在最前面"""
         try:
-            # 安全地清除网格布局中的所有控件，但不删除控件本身
-            while self.grid.count():
-                item = self.grid.takeAt(0)
-                if item and item.widget():
-                    item.widget().setParent(None)
-                    
-            # 首先添加最近刷新的商品
-            recent_widgets = []
-            other_widgets = []
-            
-            # 分组商品卡片
-            for product_id, widget in self.product_cache.items():
-                if product_id in self.last_refresh_ids:
-                    recent_widgets.append(widget)
-                else:
-                    other_widgets.append(widget)
-            
-            logger.info(f"刷新布局: 最近刷新 {len(recent_widgets)} 件, 其他商品 {len(other_widgets)} 件")
-            
-            # 使用设置的列数
-            row = 0
-            col = 0
+            search_text = self.search_input.text().lower()
             
-            # 先放置最近刷新的商品
-            for widget in recent_widgets:
-                self.grid.addWidget(widget, row, col)
-                col += 1
-                if col >= self.columns_count:  # 使用设置的列数
-                    col = 0
-                    row += 1
+            # 最近刷新的商品已在product_data最前面，只需按搜索框内容过滤
+            if search_text:
+                self.display_ids = [pid for pid in self.product_data if search_text in self.name_index[pid]]
+            else:
+                self.display_ids = list(self.product_data)
+            logger.info("刷新布局: 最近刷新 %d 件, 显示 %d 件", len(self.last_refresh_ids), len(self.display_ids))
             
-            # 再放置其他商品
-            for widget in other_widgets:
-                self.grid.addWidget(widget, row, col)
-                col += 1
-                if col >= self.columns_count:  # 使用设置的列数
-                    col = 0
-                    row += 1
+            # 按行数撑开容器高度，滚动条范围与全部商品一致
+            rows = math.ceil(len(self.display_ids) / self.columns_count)
+            self.container.setMinimumSize(
+                GRID_MARGIN * 2 + self.columns_count * (self.card_width + CARD_SPACING) - CARD_SPACING,
+                GRID_MARGIN * 2 + max(0, rows * (self.card_height + CARD_SPACING) - CARD_SPACING)
+            )
+            self.render_visible_cards()
                     
             # 更新统计信息
-            self.total_products_count = len(self.product_cache)
-            self.update_statistics()
-            logger.info(f"完成布局刷新，总共 {row*self.columns_count + col} 个位置，{self.total_products_count} 件商品")
+            self.total_products_count = len(self.product_data)
+            self.mark_statistics_dirty()
+            logger.info("完成布局刷新，总共 %d 行，%d 件商品", rows, self.total_products_count)
         except Exception as e:
             logger.error(f"刷新布局时出错: {str(e)}")
             self.update_status(f"刷新布局时出错: {str(e)}")
 
-    def add_product_card(self, product, is_new=False):
-        """创建商品卡片"""
-        card = QFrame()
-        card.setObjectName(f"product_{product['id']}")
-        
-        # 根据是否是最近刷新的商品设置不同的样式
-        if is_new:
-            card.setStyleSheet("""
-                QFrame {
-                    background: #EDF8FF;
-                    border-radius: 8px;
-                    border: 1px solid #409EFF;
-                }
-                QFrame:hover {
-                    border: 2px solid #409EFF;
-                    background: #F0F9FF;
-                }
-            """)
-        else:
-            card.setStyleSheet("""
-                QFrame {
-                    background: white;
-                    border-radius: 8px;
-                    border: 1px solid #EBEEF5;
-                }
-                QFrame:hover {
-                    border: 1px solid #409EFF;
-                    background: #F5F7FA;
-                }
-            """)
+    def render_visible_cards(self, *args):
+        """只为滚动区域中可见的行绑定卡片，离开可见区域的卡片回收到对象池"""
+        row_height = self.card_height + CARD_SPACING
+        top = self.scroll.verticalScrollBar().value()
+        bottom = top + self.scroll.viewport().height()
+        # 上下各多渲染一行，减少滚动时的空白
+        top_row = (top - GRID_MARGIN) // row_height
+        bottom_row = (bottom - GRID_MARGIN) // row_height
+        first_row = max(0, top_row - 1)
+        last_row = bottom_row + 1
+        start = first_row * self.columns_count
+        wanted = self.display_ids[start:(last_row + 1) * self.columns_count]
+        wanted_set = set(wanted)
+        
+        # 批量调整期间暂停绘制，结束后统一重绘一次
+        self.container.setUpdatesEnabled(False)
+        try:
+            # 回收不再可见的卡片
+            for pid in [pid for pid in self.visible_cards if pid not in wanted_set]:
+                self.release_card(self.visible_cards.pop(pid))
+            
+            for index, pid in enumerate(wanted, start):
+                card = self.visible_cards.get(pid)
+                if card is None:
+                    card = self.acquire_card(self.container)
+                    self.visible_cards[pid] = card
+                row, col = divmod(index, self.columns_count)
+                # 缓冲行在屏幕外，图片下载排在可见行之后
+                priority = IMAGE_PRIORITY_VISIBLE if top_row <= row <= bottom_row else IMAGE_PRIORITY_BACKGROUND
+                self.bind_product_card(card, self.product_data[pid], pid in self.last_refresh_ids, priority)
+                # 只移动位置发生变化的卡片，其余卡片保持不动
+                if card.grid_pos != (row, col):
+                    card.move(GRID_MARGIN + col * (self.card_width + CARD_SPACING),
+                              GRID_MARGIN + row * row_height)
+                    card.grid_pos = (row, col)
+                if card.isHidden():
+                    card.show()
+        finally:
+            self.container.setUpdatesEnabled(True)
+
+    def acquire_card(self, parent=None):
+        """从对象池取出一张卡片，对象池为空时新建"""
+        if self._card_pool:
+            card = self._card_pool.pop()
+            if card.parent() is not parent:
+                card.setParent(parent)
+            return card
+        return self.create_product_card(parent)
+
+    def release_card(self, card):
+        """隐藏卡片并放回对象池，留待之后重新绑定"""
+        card.hide()
+        card.grid_pos = None
+        self._card_pool.append(card)
+
+    def create_product_card(self, parent=None):
+        """创建空白的商品卡片，内容由bind_product_card填充"""
+        card = QFrame(parent)
             
         # 进一步缩小卡片尺寸
         card.setFixedSize(self.card_width, self.card_height)
@@ -1022,72 +1239,28 @@ class ProductMonitor(QMainWindow):
         img_height = int(self.card_height * 0.55)  # 图片高度占卡片的55%
         img_label.setFixedSize(img_width, img_height)
         img_label.setAlignment(Qt.AlignCenter)
-        img_label.setStyleSheet("background: #F5F7FA; border-radius: 4px;")
-        
-        # 如果product有image属性且不为空，则加载图片
-        if 'image' in product and product['image']:
-            self.thread_pool.start(ImageLoader(
-                product['image'],
-                partial(self.load_image, img_label)
-            ))
+        img_label.image_url = None
 
-        name_label = QLabel(product['name'])
+        name_label = QLabel()
         name_label.setObjectName("name")
         name_label.setWordWrap(True)
-        name_label.setStyleSheet("""
-            font: 10px 'Microsoft YaHei';
-            color: #303133;
-            max-height: 30px;
-        """)
-        name_label.setToolTip(product['name'])  # 添加工具提示，鼠标悬停时显示完整名称
         name_label.setMaximumHeight(30)
 
         price_layout = QHBoxLayout()
-        price_layout.setObjectName("price_layout")  # 添加对象名，便于后续查找
         price_layout.setSpacing(2)
-        price_label = QLabel(f"¥{product['price']:.2f}")
+        price_label = QLabel()
         price_label.setObjectName("price")
         
-        # 设置价格标签样式
-        if is_new:
-            price_label.setStyleSheet("""
-                font: bold 11px;
-                color: #E6A23C;
-                background: #FDF6EC;
-                padding: 1px 2px;
-                border-radius: 3px;
-            """)
-        else:
-            price_label.setStyleSheet("""
-                font: bold 11px;
-                color: #E6A23C;
-            """)
-        
         view_btn = QPushButton("查看")
+        view_btn.setObjectName("view")
         view_btn.setFixedSize(36, 20)  # 减小按钮尺寸
-        view_btn.setStyleSheet("""
-            background: #409EFF;
-            color: white;
-            border-radius: 3px;
-            font: 10px;
-            padding: 1px;
-        """)
-        
-        # 使用lambda捕获具体的product信息，避免引用问题
-        view_url = product['detail_url'] if 'detail_url' in product else f"https://mall.bilibili.com/neul-next/index.html?itemsId={product['id']}"
-        view_btn.clicked.connect(lambda: self.open_url(view_url))
+        # 卡片会被重复使用，点击时读取当前绑定的链接
+        view_btn.clicked.connect(lambda: self.open_url(card.detail_url))
         
-        # 如果是最近刷新的商品，添加一个"NEW"标签
-        if is_new:
-            new_label = QLabel("新")
-            new_label.setStyleSheet("""
-                background: #67C23A;
-                color: white;
-                font: bold 8px;
-                padding: 1px 2px;
-                border-radius: 3px;
-            """)
-            price_layout.addWidget(new_label)
+        # 最近刷新的商品显示"新"标签，只创建一次，按状态显示或隐藏
+        new_label = QLabel("新")
+        new_label.setObjectName("new_badge")
+        price_layout.addWidget(new_label)
             
         price_layout.addWidget(price_label)
         price_layout.addStretch()
@@ -1097,92 +1270,193 @@ class ProductMonitor(QMainWindow):
         layout.addWidget(name_label)
         layout.addLayout(price_layout)
 
-        # 使用lambda捕获具体的URL，避免引用问题
-        card.mousePressEvent = lambda e: self.open_url(view_url)
-        
+        card.mousePressEvent = lambda e: self.open_url(card.detail_url)
+        
+        # 保存子控件引用，绑定数据时无需查找
+        card.img_label = img_label
+        card.name_label = name_label
+        card.price_label = price_label
+        card.new_label = new_label
+        card.product = None
+        card.is_new = None
+        card.detail_url = ''
+        card.grid_pos = None  # 卡片在左侧网格中的(行, 列)
         return card
 
+    def bind_product_card(self, card, product, is_new=False, priority=IMAGE_PRIORITY_BACKGROUND):
+        """把商品数据填充到卡片中，数据和状态未变化时直接跳过"""
+        if card.product is product and card.is_new == is_new:
+            return
+        card.product = product
+        
+        # 根据是否是最近刷新的商品切换样式属性，样式表只在容器上解析一次
+        if card.is_new != is_new:
+            card.is_new = is_new
+            card.new_label.setVisible(is_new)
+            state = "new" if is_new else "normal"
+            card.setProperty("state", state)
+            card.price_label.setProperty("state", state)
+            # 子控件的样式依赖卡片的属性，需要一起重新应用
+            for widget in (card, card.img_label, card.name_label, card.price_label, card.new_label):
+                widget.style().unpolish(widget)
+                widget.style().polish(widget)
+        
+        card.name_label.setText(product['name'])
+        card.name_label.setToolTip(product['name'])  # 添加工具提示，鼠标悬停时显示完整名称
+        card.price_label.setText(f"¥{product['price']:.2f}")
+        card.detail_url = product['detail_url'] if 'detail_url' in product else f"https://mall.bilibili.com/neul-next/index.html?itemsId={product['id']}"
+        
+        # 如果product有image属性且不为空，则加载图片
+        image_url = product.get('image', '')
+        if image_url != card.img_label.image_url:
+            card.img_label.image_url = image_url
+            card.img_label.clear()
+            if image_url:
+                self.load_image_async(card.img_label, image_url, priority)
+
     def update_sidebar(self):
         """更新右侧边栏显示的历史最低价商品"""
+        self._sidebar_dirty = False
+        # 重建期间暂停绘制，结束后统一重绘一次
+        self.sidebar_container.setUpdatesEnabled(False)
+        old_cards = self.take_sidebar_cards()
         try:
-            # 安全地清除网格布局中的所有控件
-            while self.sidebar_grid.count():
-                item = self.sidebar_grid.takeAt(0)
-                if item and item.widget():
-                    item.widget().deleteLater()
-
-            # 按价格排序历史最低价商品（从低到高）
-            sorted_products = sorted(self.min_price_products.values(), key=lambda x: x['price'])
-                    
-            # 以网格形式显示历史最低价商品
-            row = 0
-            col = 0
-            for product in sorted_products:
-                # 确保产品有id字段
-                min_price_product = {
-                    'id': product.get('name', '').replace(' ', '_'),  # 使用name作为id
-                    'name': product.get('name', '未知商品'),
-                    'price': product.get('price', 0),
-                    'image': product.get('image', ''),
-                    'detail_url': product.get('url', '')
-                }
-                # 使用同样的卡片样式，但不标记为新商品
-                card = self.add_product_card(min_price_product, is_new=False)
-                self.sidebar_grid.addWidget(card, row, col)
-                col += 1
-                if col >= self.sidebar_columns_count:  # 使用设置的列数
-                    col = 0
-                    row += 1
+            # 历史最低价商品（已按价格从低到高排序）
+            self.sidebar_products = [self.min_price_products[name] for price, name in self.min_price_sorted]
+            # 重新创建之前已加载的数量，避免自动刷新后列表缩回第一批、滚动位置丢失
+            count = max(self.sidebar_shown, self.sidebar_columns_count * 10)
+            self.sidebar_shown = 0
+            self.append_sidebar_cards(old_cards, count)
                 
-            self.update_status(f"侧边栏已更新 {len(sorted_products)} 件最低价商品")
+            self.update_status(f"侧边栏已更新 {len(self.sidebar_products)} 件最低价商品")
         except Exception as e:
             logger.error(f"更新侧边栏时出错: {str(e)}")
             self.update_status(f"更新侧边栏时出错: {str(e)}")
+        finally:
+            self.sidebar_container.setUpdatesEnabled(True)
+            # 没有被复用的卡片回收到对象池
+            for card in old_cards.values():
+                self.release_card(card)
+
+    def take_sidebar_cards(self):
+        """把卡片从侧边栏布局中取出但不隐藏，返回 商品名 -> 卡片，供重建时复用"""
+        old_cards = self.sidebar_cards
+        self.sidebar_cards = {}
+        while self.sidebar_grid.count():
+            self.sidebar_grid.takeAt(0)
+        return old_cards
+
+    def sidebar_entry(self, product):
+        """把最低价记录转换为卡片数据，记录未变化时返回同一个对象，绑定卡片时可以直接跳过"""
+        name = product.get('name', '')
+        cached = self._sidebar_entries.get(name)
+        if cached is not None and cached[0] is product:
+            return cached[1]
+        # 确保产品有id字段
+        entry = {
+            'id': name.replace(' ', '_'),  # 使用name作为id
+            'name': product.get('name', '未知商品'),
+            'price': product.get('price', 0),
+            'image': product.get('image', ''),
+            'detail_url': product.get('url', '')
+        }
+        self._sidebar_entries[name] = (product, entry)
+        return entry
+
+    def append_sidebar_cards(self, reuse=None, count=None):
+        """向侧边栏追加count件商品卡片，默认一批10行，其余商品滚动到底部时再加载
+
+        reuse中同名商品的卡片会被取出重新摆放，不再重新创建和绑定
+        """
+        if count is None:
+            count = self.sidebar_columns_count * 10
+        # 至少比可见区域多一行，否则没有滚动条，无法通过滚动加载后续商品
+        fill_rows = self.sidebar_scroll.viewport().height() // (self.card_height + CARD_SPACING) + 2
+        end = min(len(self.sidebar_products),
+                  max(self.sidebar_shown + count, fill_rows * self.sidebar_columns_count))
+        for index in range(self.sidebar_shown, end):
+            product = self.sidebar_products[index]
+            name = product.get('name', '')
+            row, col = divmod(index, self.sidebar_columns_count)
+            card = reuse.pop(name, None) if reuse else None
+            if card is None:
+                card = self.acquire_card(self.sidebar_container)
+            # 使用同样的卡片样式，但不标记为新商品
+            self.bind_product_card(card, self.sidebar_entry(product), is_new=False,
+                                   priority=self.sidebar_image_priority(row))
+            self.sidebar_grid.addWidget(card, row, col)
+            if card.isHidden():
+                card.show()
+            self.sidebar_cards[name] = card
+        self.sidebar_shown = end
+
+    def on_sidebar_scroll(self, *args):
+        """侧边栏滚动到接近底部时加载下一批商品
+
+        滚动范围变化时（如窗口拉高后）也会调用，可见区域接近底部时继续加载
+        """
+        if self.sidebar_shown >= len(self.sidebar_products):
+            return
+        scroll_bar = self.sidebar_scroll.verticalScrollBar()
+        if scroll_bar.value() >= scroll_bar.maximum() - (self.card_height + CARD_SPACING):
+            self.append_sidebar_cards()
+
+    def eventFilter(self, obj, event):
+        """侧边栏第一次显示时才创建历史最低价商品卡片"""
+        if obj is self.sidebar_scroll and event.type() == QEvent.Show and self._sidebar_dirty:
+            self.update_sidebar()
+        return super().eventFilter(obj, event)
 
-    def save_product_cache(self):
-        """保存商品缓存到本地文件"""
+    def save_product_cache(self, compact=False):
+        """把变化的商品追加到增量日志，积累足够批次或关闭程序时整理为完整快照，写入在后台线程进行"""
         try:
-            # 只保存必要的信息，不保存UI组件
-            cache_data = {}
-            for pid, widget in self.product_cache.items():
-                name_label = widget.findChild(QLabel, "name")
-                price_label = widget.findChild(QLabel, "price")
-                
-                if name_label and price_label:
-                    name = name_label.text()
-                    price = price_label.text().replace("¥", "")
-                    
-                    try:
-                        price_float = float(price)
-                    except ValueError:
-                        price_float = 0.0
-                        
-                    cache_data[pid] = {
-                        'id': pid,
-                        'name': name,
-                        'price': price_float,
-                        'image': '',  # 图片URL可能会变化，暂不保存
-                        'detail_url': f"https://mall.bilibili.com/neul-next/index.html?itemsId={pid}"
-                    }
-            
-            with open('product_cache.json', 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False)
-            logger.info(f"已保存 {len(cache_data)} 件商品缓存")
+            if compact or self._cache_compact_pending or self._cache_log_batches >= PRODUCT_CACHE_COMPACT_BATCHES:
+                cache_data = {pid: product_cache_entry(pid, product) for pid, product in self.product_data.items()}
+                self.persistence_worker.submit(write_json_snapshot, 'product_cache.json', cache_data, 'product_cache.ndjson')
+                self._cache_log_batches = 0
+                self._cache_compact_pending = False
+                self._cache_order_dirty = False
+                logger.info("整理商品缓存快照: %d 件商品", len(cache_data))
+            elif self._dirty_ids:
+                # 每批写成一行，按显示顺序排列；变化的商品都是刚刷新的，位于product_data前部
+                batch = {}
+                for pid in self.product_data:
+                    if pid in self._dirty_ids:
+                        batch[pid] = product_cache_entry(pid, self.product_data[pid])
+                        if len(batch) == len(self._dirty_ids):
+                            break
+                self.persistence_worker.submit(append_json_lines, 'product_cache.ndjson', [batch])
+                self._cache_log_batches += 1
+                logger.info("追加 %d 件变化的商品到缓存日志", len(batch))
+            self._dirty_ids.clear()
         except Exception as e:
             logger.error(f"保存商品缓存失败: {str(e)}")
 
     def load_product_cache(self):
         """从本地文件加载商品缓存"""
         try:
-            if os.path.exists('product_cache.json'):
-                with open('product_cache.json', 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
+            has_snapshot = os.path.exists('product_cache.json')
+            if has_snapshot or os.path.exists('product_cache.ndjson'):
+                cache_data = read_json_file('product_cache.json') if has_snapshot else {}
+                # 按顺序重放增量日志，同一商品以最后一条为准
+                batches = []
+                if os.path.exists('product_cache.ndjson'):
+                    batches = read_json_lines('product_cache.ndjson')
+                    for batch in batches:
+                        cache_data.update(batch)
+                    # 上次未能正常整理快照，下次保存时合并
+                    self._cache_compact_pending = True
                 
-                # 创建商品卡片并添加到缓存
-                for pid, data in cache_data.items():
-                    self.product_cache[pid] = self.add_product_card(data)
+                # 只加载商品数据，卡片在显示时才创建
+                self.product_data.update(cache_data)
+                # 日志中越靠后的批次越新，逐批移到最前面，恢复最近刷新在前的顺序
+                # 只调整了顺序而没有数据变化的商品不写日志，它们的顺序在正常关闭时随快照保存
+                for batch in batches:
+                    for pid in reversed(list(batch)):
+                        self.product_data.move_to_end(pid, last=False)
+                self.name_index.update((pid, data['name'].lower()) for pid, data in cache_data.items())
                 
-                self.total_products_count = len(self.product_cache)
+                self.total_products_count = len(self.product_data)
                 logger.info(f"已加载 {self.total_products_count} 件商品缓存")
                 
                 # 输出加载的商品详情，便于调试
@@ -1192,13 +1466,19 @@ class ProductMonitor(QMainWindow):
                     logger.info(f"... 还有 {len(cache_data) - 5} 件商品")
         except Exception as e:
             logger.error(f"加载商品缓存失败: {str(e)}")
-            self.product_cache = {}
+            self.product_data = OrderedDict()
+            self.name_index = {}
             self.total_products_count = 0
             
     def closeEvent(self, event):
         """程序关闭时保存数据"""
+        self._save_min_timer.stop()
         self.save_min_price_products()
-        self.save_product_cache()
+        self._save_cache_timer.stop()
+        if self._cache_log_batches or self._dirty_ids or self._cache_compact_pending or self._cache_order_dirty:
+            self.save_product_cache(compact=True)
+        self.persistence_worker.stop()
+        self._save_settings_timer.stop()
         self.save_settings()
         super().closeEvent(event)
 
@@ -1214,13 +1494,18 @@ class ProductMonitor(QMainWindow):
                 self.remaining_time = self.refresh_interval
             
             # 更新倒计时显示
-            self.countdown_label.setText(f"下次刷新: {self.remaining_time} 秒")
+            text = f"下次刷新: {self.remaining_time} 秒"
+            if self.countdown_label.text() != text:
+                self.countdown_label.setText(text)
             
             # 如果剩余时间小于5秒，改变颜色提示
-            if self.remaining_time <= 5:
-                self.countdown_label.setStyleSheet("color: #E6A23C; font-weight: bold;")
-            else:
-                self.countdown_label.setStyleSheet("color: #606266;")
+            self.set_countdown_mode('warn' if self.remaining_time <= 5 else 'normal')
+
+    def set_countdown_mode(self, mode):
+        """切换倒计时标签的样式，状态没有变化时不重新设置样式表"""
+        if mode != self._countdown_mode:
+            self._countdown_mode = mode
+            self.countdown_label.setStyleSheet(COUNTDOWN_STYLES[mode])
         
     def toggle_pause(self):
         """暂停或继续自动刷新"""
@@ -1239,7 +1524,7 @@ class ProductMonitor(QMainWindow):
                 min-width: 80px;
             """)
             self.countdown_label.setText("已暂停自动刷新")
-            self.countdown_label.setStyleSheet("color: #F56C6C; font-weight: bold;")
+            self.set_countdown_mode('paused')
             self.update_status("已暂停自动刷新")
         else:
             # 继续定时器
@@ -1297,10 +1582,8 @@ class ProductMonitor(QMainWindow):
         if not self.price_alert_enabled or self.price_alert_threshold <= 0:
             return
             
-        alert_products = []
-        for product in products:
-            if product['price'] <= self.price_alert_threshold:
-                alert_products.append(product)
+        threshold = self.price_alert_threshold
+        alert_products = [product for product in products if product['price'] <= threshold]
                 
         if alert_products:
             # 发出系统通知
@@ -1415,7 +1698,7 @@ class ProductMonitor(QMainWindow):
         self.update_status(f"已复制到剪贴板: {text[:20]}...")
 
 class WorkerThread(QThread):
-    update_signal = pyqtSignal(list)
+    update_signal = pyqtSignal(list, list)  # 商品列表, 最低价更新[(商品名, 记录)]
     error_signal = pyqtSignal(str)
     auto_load_signal = pyqtSignal()  # 添加自动加载更多信号
 
@@ -1427,26 +1710,32 @@ class WorkerThread(QThread):
         self.auto_load_more = False  # 是否自动加载更多
         self.auto_load_pages = 3  # 自动加载的页数
         self.api_cooldown = 2000  # API请求冷却时间(毫秒)
+        # 复用同一个会话保持长连接，连续加载多页时无需每次重新握手
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        })
 
     def run(self):
         try:
+            # Cookie可能随时被用户更新，每次请求时读取
             headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
                 "Cookie": self.parent.cookies.get("cookie", "")
             }
             
             if self.is_refresh:
-                logger.info(f"执行刷新操作，重置nextId为None")
+                logger.info("执行刷新操作，重置nextId为None")
                 self.next_id = None
                 self.is_refresh = False
             
-            logger.info(f"开始请求商品数据，操作类型: {'刷新' if self.next_id is None else '加载更多'}, nextId: {self.next_id}")
+            logger.info("开始请求商品数据，操作类型: %s, nextId: %s", '刷新' if self.next_id is None else '加载更多', self.next_id)
             
             # 发送请求获取商品数据
             request_data = {"sortType": "TIME_DESC", "nextId": self.next_id}
-            logger.info(f"请求参数: {request_data}")
+            logger.info("请求参数: %s", request_data)
             
-            response = requests.post(
+            response = self.session.post(
                 "https://mall.bilibili.com/mall-magic-c/internet/c2c/v2/list",
                 json=request_data,
                 headers=headers,
@@ -1454,30 +1743,30 @@ class WorkerThread(QThread):
             )
             
             if response.status_code == 200:
-                data = response.json()
-                logger.info(f"API响应状态码: {data.get('code')}, 消息: {data.get('message')}")
+                data = parse_json(response.content)
+                logger.info("API响应状态码: %s, 消息: %s", data.get('code'), data.get('message'))
                 
-                products = self.process_response(data)
-                logger.info(f"成功处理 {len(products)} 件商品数据")
+                products, min_price_deltas = self.process_response(data)
+                logger.info("成功处理 %d 件商品数据", len(products))
                 
                 # 保存nextId用于下次加载
                 next_id = data.get('data', {}).get('nextId')
                 if next_id:
                     old_next_id = self.next_id
                     self.next_id = next_id
-                    logger.info(f"更新nextId: {old_next_id} -> {self.next_id}")
+                    logger.info("更新nextId: %s -> %s", old_next_id, self.next_id)
                     
                     # 如果设置了自动加载更多，且还有页数需要加载
                     if self.auto_load_more and self.auto_load_pages > 1:
                         self.auto_load_pages -= 1
-                        logger.info(f"启动自动加载更多，剩余页数: {self.auto_load_pages}")
+                        logger.info("启动自动加载更多，剩余页数: %d", self.auto_load_pages)
                         # 发送信号，触发再次加载
                         self.auto_load_signal.emit()
                 else:
                     logger.info("没有更多商品数据了，nextId为空")
                     self.auto_load_more = False
                 
-                self.update_signal.emit(products)
+                self.update_signal.emit(products, min_price_deltas)
             else:
                 self.error_signal.emit(f"请求失败 [{response.status_code}]")
         except Exception as e:
@@ -1485,13 +1774,23 @@ class WorkerThread(QThread):
             logger.error(f"请求商品数据出错: {str(e)}")
 
     def process_response(self, data):
-        """优化数据处理性能"""
+        """解析商品数据，并找出比现有记录更低的价格
+
+        只读取最低价记录，不在工作线程中修改，更新交给主线程的apply_min_price_deltas
+        """
         try:
             if data.get('code') != 0:
                 raise ValueError(data.get('message', '未知错误'))
             
-            products = []
-            for item in data.get('data', {}).get('data', []):
+            items = data.get('data', {}).get('data', [])
+            # 预先分配列表，跳过的异常商品在最后截掉
+            products = [None] * len(items)
+            count = 0
+            # 只读取，不在工作线程中修改最低价记录
+            min_price_products = self.parent.min_price_products
+            batch_min_prices = {}  # 本页中每个商品名的最低价，同一页可能有多件同名商品
+            now = time.time()
+            for item in items:
                 try:
                     product_id = str(item.get('c2cItemsId', ''))
                     detail = item.get('detailDtoList', [{}])[0]
@@ -1504,26 +1803,28 @@ class WorkerThread(QThread):
                         'detail_url': f"https://mall.bilibili.com/neul-next/index.html?itemsId={product_id}"
                     }
                     
-                    # 更新最低价记录，确保记录中包含id字段
-                    if product['name'] not in self.parent.min_price_products or \
-                       product['price'] < self.parent.min_price_products[product['name']]['price']:
-                        self.parent.min_price_products[product['name']] = {
+                    # 记录更低的价格，确保记录中包含id字段
+                    previous = batch_min_prices.get(product['name']) or min_price_products.get(product['name'])
+                    if previous is None or product['price'] < previous['price']:
+                        batch_min_prices[product['name']] = {
                             'id': product_id,  # 添加id字段
                             'name': product['name'],
                             'price': product['price'],
                             'image': product['image'],
                             'url': product['detail_url'],
-                            'timestamp': time.time()
+                            'timestamp': now
                         }
                     
-                    products.append(product)
+                    products[count] = product
+                    count += 1
                 except Exception as e:
-                    logger.error(f"商品数据处理异常: {str(e)}")
+                    logger.error("商品数据处理异常: %s", e)
             
-            return products
+            del products[count:]
+            return products, list(batch_min_prices.items())
         except Exception as e:
             self.error_signal.emit(f"数据处理失败: {str(e)}")
-            return []
+            return [], []
 
     def refresh_data(self):
         """设置为刷新模式，并启用自动加载更多"""